@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import asdict, dataclass
+import threading
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
+from itertools import cycle, groupby
+from operator import attrgetter
 from pathlib import Path
+from time import monotonic
 from typing import Dict, List, Mapping, Optional, Tuple
 
+import orjson
 from flask import (
     Flask,
     current_app,
@@ -18,13 +24,29 @@ from flask import (
     session,
     url_for,
 )
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.security import check_password_hash, generate_password_hash
 
 BASE_DIR = Path(__file__).resolve().parent
 DATABASE_PATH = BASE_DIR / "timesheet.db"
+# Stored in PRAGMA user_version; bump when init_db's DDL changes so existing
+# databases get migrated exactly once.
+SCHEMA_VERSION = 2
 DEFAULT_CALENDAR_SLOT_MINUTES = 30
 DEFAULT_CALENDAR_SLOT_HEIGHT = 24
 
+# Deliberate, pinned hash cost rather than whatever werkzeug happens to default
+# to. scrypt runs in hashlib's C implementation, which releases the GIL, so
+# concurrent logins under a threaded worker don't serialize on hashing the way
+# werkzeug's pure-Python pbkdf2 does. Existing pbkdf2 hashes keep verifying —
+# check_password_hash dispatches on the stored hash's own method prefix.
+PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+
+ChargeCard = namedtuple(
+    "ChargeCard", "id project_number task_number description color_class"
+)
+
 CHARGE_COLOR_CLASSES = [
     "charge-color-0",
     "charge-color-1",
@@ -39,31 +61,62 @@ CHARGE_COLOR_CLASSES = [
 ]
 
 
+def _build_minute_labels() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    labels = []
+    ampm = []
+    for minutes in range(24 * 60 + 1):
+        hours, mins = divmod(minutes, 60)
+        labels.append(f"{hours:02d}:{mins:02d}")
+        suffix = "AM" if hours < 12 else "PM"
+        hour12 = hours % 12 or 12
+        ampm.append(f"{hour12}:{mins:02d} {suffix}")
+    return tuple(labels), tuple(ampm)
+
+
+# The template filters only ever see minutes within a single day, so both
+# label shapes are precomputed once and each call is a tuple index.
+_MINUTE_LABELS, _MINUTE_AMPM = _build_minute_labels()
+
+
 def minutes_to_label(total_minutes: int) -> str:
-    minutes = int(total_minutes)
-    hours, mins = divmod(minutes, 60)
-    return f"{hours:02d}:{mins:02d}"
+    return _MINUTE_LABELS[int(total_minutes)]
 
 
 def minutes_to_ampm(total_minutes: int) -> str:
-    minutes = int(total_minutes)
-    hours, mins = divmod(minutes, 60)
-    suffix = "AM" if hours < 12 else "PM"
-    hour12 = hours % 12 or 12
-    return f"{hour12}:{mins:02d} {suffix}"
+    return _MINUTE_AMPM[int(total_minutes)]
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C-level encoder/decoder."""
+
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: object) -> object:
+        return orjson.loads(s)
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.update(
         SECRET_KEY="change-me",
         DATABASE=str(DATABASE_PATH),
     )
 
+    cache_dir = BASE_DIR / ".jinja_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+        directory=str(cache_dir), pattern="%s.cache"
+    )
+    app.jinja_env.auto_reload = False
+
     app.jinja_env.filters["minutes_to_label"] = minutes_to_label
     app.jinja_env.filters["minutes_to_ampm"] = minutes_to_ampm
 
-    Path(app.config["DATABASE"]).parent.mkdir(parents=True, exist_ok=True)
+    db_dir = Path(app.config["DATABASE"]).parent
+    if not db_dir.is_dir():
+        db_dir.mkdir(parents=True, exist_ok=True)
 
     @app.before_request
     def load_logged_in_user() -> None:
@@ -74,29 +127,42 @@ def create_app() -> Flask:
         else:
             g.user = get_user_by_id(user_id)
 
-    @app.teardown_appcontext
-    def close_db(exception: Optional[BaseException]) -> None:  # pragma: no cover - teardown
-        db = g.pop("db", None)
-        if db is not None:
-            db.close()
-
     register_routes(app)
     with app.app_context():
         init_db()
     return app
 
 
+_connections = threading.local()
+
+
 def get_db() -> sqlite3.Connection:
-    if "db" not in g:
-        conn = sqlite3.connect(current_app.config["DATABASE"])
+    """Return this thread's long-lived connection, opening it on first use.
+
+    Keeping one connection per worker thread (instead of open/close per
+    request) amortizes connection setup and keeps SQLite's statement and
+    query-plan caches warm. Each thread owns its connection exclusively,
+    which is why check_same_thread=False is safe here.
+    """
+    database = current_app.config["DATABASE"]
+    conn = getattr(_connections, "conn", None)
+    if conn is None or _connections.database != database:
+        conn = sqlite3.connect(database, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row
-        g.db = conn
-    return g.db
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _connections.conn = conn
+        _connections.database = database
+    return conn
 
 
 def init_db() -> None:
     conn = sqlite3.connect(current_app.config["DATABASE"])
     try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS users (
@@ -132,19 +198,48 @@ def init_db() -> None:
                 FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
                 FOREIGN KEY(charge_code_id) REFERENCES charge_codes(id) ON DELETE CASCADE
             );
+
+            CREATE INDEX IF NOT EXISTS idx_time_entries_user_date
+                ON time_entries(user_id, entry_date);
+            CREATE INDEX IF NOT EXISTS idx_time_entries_charge
+                ON time_entries(charge_code_id);
+            CREATE INDEX IF NOT EXISTS idx_charge_codes_user
+                ON charge_codes(user_id);
             """
         )
-        conn.commit()
-        try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(charge_codes)")}
+        if "is_active" not in columns:
             conn.execute("ALTER TABLE charge_codes ADD COLUMN is_active INTEGER NOT NULL DEFAULT 1")
-        except sqlite3.OperationalError:
-            pass
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
     finally:
         conn.close()
 
 
+# load_logged_in_user resolves the same user row on every request; cache it
+# briefly so the common case skips the SELECT. Login never reads this cache
+# (it fetches by email), and logout evicts the entry explicitly.
+_USER_CACHE_TTL_SECONDS = 60.0
+_user_cache: Dict[int, Tuple[float, sqlite3.Row]] = {}
+_user_cache_lock = threading.Lock()
+
+
 def get_user_by_id(user_id: int) -> Optional[sqlite3.Row]:
-    return g.db.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+    now = monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+    user = g.db.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+    if user is not None:
+        with _user_cache_lock:
+            _user_cache[user_id] = (now + _USER_CACHE_TTL_SECONDS, user)
+    return user
+
+
+def evict_cached_user(user_id: int) -> None:
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
 
 
 def register_routes(app: Flask) -> None:
@@ -174,7 +269,7 @@ def register_routes(app: Flask) -> None:
             if error:
                 flash(error, "error")
             else:
-                password_hash = generate_password_hash(password)
+                password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
                 now = datetime.utcnow().isoformat(timespec="seconds")
                 g.db.execute(
                     "INSERT INTO users (email, name, password_hash, created_at) VALUES (?, ?, ?, ?)",
@@ -208,6 +303,9 @@ def register_routes(app: Flask) -> None:
 
     @app.route("/logout")
     def logout():
+        user_id = session.get("user_id")
+        if user_id is not None:
+            evict_cached_user(user_id)
         session.clear()
         return redirect(url_for("login"))
 
@@ -218,7 +316,7 @@ def register_routes(app: Flask) -> None:
 
         anchor = request.args.get("date")
         try:
-            anchor_date = datetime.strptime(anchor, "%Y-%m-%d").date() if anchor else date.today()
+            anchor_date = _parse_ymd(anchor) if anchor else date.today()
         except ValueError:
             anchor_date = date.today()
 
@@ -226,21 +324,19 @@ def register_routes(app: Flask) -> None:
         entries = fetch_time_entries(g.user["id"], week_start, week_end)
 
         raw_codes = list_charge_codes(g.user["id"])
-        color_count = len(CHARGE_COLOR_CLASSES) or 1
         charge_color_map: Dict[int, str] = {}
         active_charge_codes = []
-        for index, row in enumerate(raw_codes):
-            color_class = CHARGE_COLOR_CLASSES[index % color_count]
+        for row, color_class in zip(raw_codes, cycle(CHARGE_COLOR_CLASSES)):
             charge_color_map[row["id"]] = color_class
             if row["is_active"]:
                 active_charge_codes.append(
-                    {
-                        "id": row["id"],
-                        "project_number": row["project_number"],
-                        "task_number": row["task_number"],
-                        "description": row["description"],
-                        "color_class": color_class,
-                    }
+                    ChargeCard(
+                        row["id"],
+                        row["project_number"],
+                        row["task_number"],
+                        row["description"],
+                        color_class,
+                    )
                 )
 
         display_start_minutes = 7 * 60
@@ -252,7 +348,8 @@ def register_routes(app: Flask) -> None:
             window_start=display_start_minutes,
             window_end=display_end_minutes,
         )
-        overview = build_week_overview(entries, week_start, week_end)
+        totals = fetch_week_totals(g.user["id"], week_start, week_end)
+        overview = build_week_overview(entries, totals, week_start, week_end)
         week_days = [week_start + timedelta(days=i) for i in range(7)]
         prev_week = week_start - timedelta(days=7)
         next_week = week_start + timedelta(days=7)
@@ -365,54 +462,22 @@ def register_routes(app: Flask) -> None:
                 flash("Entry not found.", "error")
                 return redirect(url_for("dashboard"))
 
-        error, cleaned = prepare_time_entry_payload(g.user["id"], request.form, existing)
+        error, cleaned = prepare_time_entry_payload(request.form, existing)
         if error:
             flash(error, "error")
             return redirect(_dashboard_redirect_target(request.form.get("anchor_date")))
 
         now = datetime.utcnow().isoformat(timespec="seconds")
         if existing is None:
-            cur = g.db.execute(
-                """
-                INSERT INTO time_entries
-                (user_id, charge_code_id, entry_date, start_time, end_time, duration_minutes, activity_text, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    g.user["id"],
-                    cleaned["charge_code_id"],
-                    cleaned["entry_date"].isoformat(),
-                    cleaned["start_time"].strftime("%H:%M"),
-                    cleaned["end_time"].strftime("%H:%M"),
-                    cleaned["duration_minutes"],
-                    cleaned["activity_text"],
-                    now,
-                    now,
-                ),
-            )
-            g.db.commit()
-            flash("Entry added.", "success")
+            if insert_time_entry(g.user["id"], cleaned, now) is None:
+                flash("Invalid charge code.", "error")
+            else:
+                flash("Entry added.", "success")
         else:
-            g.db.execute(
-                """
-                UPDATE time_entries
-                SET charge_code_id = ?, entry_date = ?, start_time = ?, end_time = ?, duration_minutes = ?, activity_text = ?, updated_at = ?
-                WHERE id = ? AND user_id = ?
-                """,
-                (
-                    cleaned["charge_code_id"],
-                    cleaned["entry_date"].isoformat(),
-                    cleaned["start_time"].strftime("%H:%M"),
-                    cleaned["end_time"].strftime("%H:%M"),
-                    cleaned["duration_minutes"],
-                    cleaned["activity_text"],
-                    now,
-                    entry_id,
-                    g.user["id"],
-                ),
-            )
-            g.db.commit()
-            flash("Entry updated.", "success")
+            if update_time_entry_row(entry_id, g.user["id"], cleaned, now):
+                flash("Entry updated.", "success")
+            else:
+                flash("Invalid charge code.", "error")
 
         return redirect(_dashboard_redirect_target(request.form.get("anchor_date")))
 
@@ -437,47 +502,32 @@ def register_routes(app: Flask) -> None:
         start = request.args.get("start")
         end = request.args.get("end")
         try:
-            start_date = datetime.strptime(start, "%Y-%m-%d").date() if start else date.today()
-            end_date = datetime.strptime(end, "%Y-%m-%d").date() if end else start_date
+            start_date = _parse_ymd(start) if start else date.today()
+            end_date = _parse_ymd(end) if end else start_date
         except ValueError:
             return jsonify({"error": "Invalid date range"}), 400
 
         entries = fetch_time_entries(g.user["id"], start_date, end_date)
-        return jsonify([asdict(entry) for entry in entries])
+        return jsonify([entry.to_dict() for entry in entries])
 
     @app.route("/api/time_entries", methods=["POST"])
     def create_time_entry():
         if g.user is None:
             return jsonify({"error": "Not authenticated"}), 401
 
-        data = request.json or {}
-        error, cleaned = prepare_time_entry_payload(g.user["id"], data)
+        data = _request_json()
+        if data is None:
+            return jsonify({"error": "Invalid payload."}), 400
+        error, cleaned = prepare_time_entry_payload(data)
         if error:
             return jsonify({"error": error}), 400
 
         now = datetime.utcnow().isoformat(timespec="seconds")
-        cur = g.db.execute(
-            """
-            INSERT INTO time_entries
-            (user_id, charge_code_id, entry_date, start_time, end_time, duration_minutes, activity_text, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                g.user["id"],
-                cleaned["charge_code_id"],
-                cleaned["entry_date"].isoformat(),
-                cleaned["start_time"].strftime("%H:%M"),
-                cleaned["end_time"].strftime("%H:%M"),
-                cleaned["duration_minutes"],
-                cleaned["activity_text"],
-                now,
-                now,
-            ),
-        )
-        g.db.commit()
-        entry_id = cur.lastrowid
-        entry = fetch_time_entry(entry_id, g.user["id"])
-        return jsonify(asdict(entry)), 201
+        new_id = insert_time_entry(g.user["id"], cleaned, now)
+        if new_id is None:
+            return jsonify({"error": "Invalid charge code."}), 400
+        entry = build_entry_dto(new_id, cleaned)
+        return jsonify(entry.to_dict()), 201
 
     @app.route("/api/time_entries/<int:entry_id>", methods=["PUT"])
     def update_time_entry(entry_id: int):
@@ -488,33 +538,18 @@ def register_routes(app: Flask) -> None:
         if existing is None:
             return jsonify({"error": "Entry not found"}), 404
 
-        data = request.json or {}
-        error, cleaned = prepare_time_entry_payload(g.user["id"], data, existing)
+        data = _request_json()
+        if data is None:
+            return jsonify({"error": "Invalid payload."}), 400
+        error, cleaned = prepare_time_entry_payload(data, existing)
         if error:
             return jsonify({"error": error}), 400
 
         now = datetime.utcnow().isoformat(timespec="seconds")
-        g.db.execute(
-            """
-            UPDATE time_entries
-            SET charge_code_id = ?, entry_date = ?, start_time = ?, end_time = ?, duration_minutes = ?, activity_text = ?, updated_at = ?
-            WHERE id = ? AND user_id = ?
-            """,
-            (
-                cleaned["charge_code_id"],
-                cleaned["entry_date"].isoformat(),
-                cleaned["start_time"].strftime("%H:%M"),
-                cleaned["end_time"].strftime("%H:%M"),
-                cleaned["duration_minutes"],
-                cleaned["activity_text"],
-                now,
-                entry_id,
-                g.user["id"],
-            ),
-        )
-        g.db.commit()
-        updated = fetch_time_entry(entry_id, g.user["id"])
-        return jsonify(asdict(updated))
+        if not update_time_entry_row(entry_id, g.user["id"], cleaned, now):
+            return jsonify({"error": "Invalid charge code."}), 400
+        updated = build_entry_dto(entry_id, cleaned)
+        return jsonify(updated.to_dict())
 
     @app.route("/api/time_entries/<int:entry_id>", methods=["DELETE"])
     def delete_time_entry(entry_id: int):
@@ -529,7 +564,7 @@ def register_routes(app: Flask) -> None:
         return jsonify({"status": "ok"})
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EntryDTO:
     id: int
     charge_code_id: int
@@ -539,6 +574,22 @@ class EntryDTO:
     end_time: str
     duration_minutes: int
     activity_text: str
+    start_minutes: int
+
+    def to_dict(self) -> Dict[str, object]:
+        # Flat dict by hand: dataclasses.asdict recurses with deepcopy
+        # semantics, which is wasted work for a DTO of scalars.
+        return {
+            "id": self.id,
+            "charge_code_id": self.charge_code_id,
+            "charge_code_label": self.charge_code_label,
+            "entry_date": self.entry_date,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_minutes": self.duration_minutes,
+            "activity_text": self.activity_text,
+            "start_minutes": self.start_minutes,
+        }
 
 
 def user_exists(email: str) -> bool:
@@ -546,79 +597,175 @@ def user_exists(email: str) -> bool:
     return row is not None
 
 
+# Column order shared by the entry SELECTs and _entry_row_factory below. The
+# label is concatenated inside SQLite so Python only assigns the finished string.
+_ENTRY_COLUMNS = """
+    te.id, te.charge_code_id, te.entry_date, te.start_time, te.end_time,
+    te.duration_minutes, te.activity_text,
+    cc.project_number || '-' || cc.task_number || ' ' || cc.description
+"""
+
+# Hot-path statements pinned as module constants so every caller passes the
+# identical string and sqlite3's prepared-statement cache always hits instead
+# of re-preparing a freshly built string.
+_FETCH_ENTRY_SQL = f"""
+    SELECT {_ENTRY_COLUMNS}
+    FROM time_entries te
+    JOIN charge_codes cc ON cc.id = te.charge_code_id
+    WHERE te.id = ? AND te.user_id = ?
+"""
+
+_FETCH_ENTRIES_SQL = f"""
+    SELECT {_ENTRY_COLUMNS}
+    FROM time_entries te
+    JOIN charge_codes cc ON cc.id = te.charge_code_id
+    WHERE te.user_id = ? AND te.entry_date BETWEEN ? AND ?
+    ORDER BY te.entry_date ASC, te.start_time ASC
+"""
+
+_CHARGE_CODE_LABEL_SQL = (
+    "SELECT project_number || '-' || task_number || ' ' || description"
+    " FROM charge_codes WHERE id = ?"
+)
+
+_WEEK_TOTALS_SQL = """
+    SELECT cc.project_number || '-' || cc.task_number || ' ' || cc.description AS label,
+           te.entry_date,
+           SUM(te.duration_minutes) AS minutes
+    FROM time_entries te
+    JOIN charge_codes cc ON cc.id = te.charge_code_id
+    WHERE te.user_id = ? AND te.entry_date BETWEEN ? AND ?
+    GROUP BY cc.id, te.entry_date
+"""
+
+_LIST_CHARGE_CODES_SQL = """
+    SELECT id, project_number, task_number, description, is_active
+    FROM charge_codes
+    WHERE user_id = ?
+    ORDER BY project_number, task_number
+"""
+
+_INSERT_ENTRY_SQL = """
+    INSERT INTO time_entries
+    (user_id, charge_code_id, entry_date, start_time, end_time, duration_minutes, activity_text, created_at, updated_at)
+    SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?
+    WHERE EXISTS (SELECT 1 FROM charge_codes WHERE id = ? AND user_id = ?)
+"""
+
+_UPDATE_ENTRY_SQL = """
+    UPDATE time_entries
+    SET charge_code_id = ?, entry_date = ?, start_time = ?, end_time = ?, duration_minutes = ?, activity_text = ?, updated_at = ?
+    WHERE id = ? AND user_id = ?
+    AND EXISTS (SELECT 1 FROM charge_codes WHERE id = ? AND user_id = ?)
+"""
+
+
+def _entry_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> EntryDTO:
+    return EntryDTO(
+        id=row[0],
+        charge_code_id=row[1],
+        charge_code_label=row[7],
+        entry_date=row[2],
+        start_time=row[3],
+        end_time=row[4],
+        duration_minutes=row[5],
+        activity_text=row[6],
+        start_minutes=int(row[3][:2]) * 60 + int(row[3][3:]),
+    )
+
+
 def fetch_time_entry(entry_id: int, user_id: int) -> Optional[EntryDTO]:
-    row = g.db.execute(
-        """
-        SELECT te.*, cc.project_number, cc.task_number, cc.description
-        FROM time_entries te
-        JOIN charge_codes cc ON cc.id = te.charge_code_id
-        WHERE te.id = ? AND te.user_id = ?
-        """,
-        (entry_id, user_id),
-    ).fetchone()
-    if row is None:
-        return None
-    label = f"{row['project_number']}-{row['task_number']} {row['description']}"
+    cur = g.db.execute(_FETCH_ENTRY_SQL, (entry_id, user_id))
+    cur.row_factory = _entry_row_factory
+    return cur.fetchone()
+
+
+def fetch_charge_code_label(charge_code_id: int) -> str:
+    row = g.db.execute(_CHARGE_CODE_LABEL_SQL, (charge_code_id,)).fetchone()
+    return row[0]
+
+
+def build_entry_dto(entry_id: int, cleaned: Dict[str, object]) -> EntryDTO:
     return EntryDTO(
-        id=row["id"],
-        charge_code_id=row["charge_code_id"],
-        charge_code_label=label,
-        entry_date=row["entry_date"],
-        start_time=row["start_time"],
-        end_time=row["end_time"],
-        duration_minutes=row["duration_minutes"],
-        activity_text=row["activity_text"],
+        id=entry_id,
+        charge_code_id=cleaned["charge_code_id"],
+        charge_code_label=fetch_charge_code_label(cleaned["charge_code_id"]),
+        entry_date=cleaned["entry_date"].isoformat(),
+        start_time=cleaned["start_time"].strftime("%H:%M"),
+        end_time=cleaned["end_time"].strftime("%H:%M"),
+        duration_minutes=cleaned["duration_minutes"],
+        activity_text=cleaned["activity_text"],
+        start_minutes=cleaned["start_time"].hour * 60 + cleaned["start_time"].minute,
     )
 
 
 def fetch_time_entries(user_id: int, start: date, end: date) -> List[EntryDTO]:
-    rows = g.db.execute(
-        """
-        SELECT te.*, cc.project_number, cc.task_number, cc.description
-        FROM time_entries te
-        JOIN charge_codes cc ON cc.id = te.charge_code_id
-        WHERE te.user_id = ? AND te.entry_date BETWEEN ? AND ?
-        ORDER BY te.entry_date ASC, te.start_time ASC
-        """,
-        (user_id, start.isoformat(), end.isoformat()),
-    ).fetchall()
-    entries = []
-    for row in rows:
-        label = f"{row['project_number']}-{row['task_number']} {row['description']}"
-        entries.append(
-            EntryDTO(
-                id=row["id"],
-                charge_code_id=row["charge_code_id"],
-                charge_code_label=label,
-                entry_date=row["entry_date"],
-                start_time=row["start_time"],
-                end_time=row["end_time"],
-                duration_minutes=row["duration_minutes"],
-                activity_text=row["activity_text"],
-            )
-        )
-    return entries
+    cur = g.db.execute(_FETCH_ENTRIES_SQL, (user_id, start.isoformat(), end.isoformat()))
+    cur.row_factory = _entry_row_factory
+    return cur.fetchall()
 
 
-def list_charge_codes(user_id: int):
-    rows = g.db.execute(
-        """
-        SELECT id, project_number, task_number, description, is_active
-        FROM charge_codes
-        WHERE user_id = ?
-        ORDER BY project_number, task_number
-        """,
-        (user_id,),
+def fetch_week_totals(user_id: int, start: date, end: date) -> List[sqlite3.Row]:
+    """Aggregate minutes per charge code per day in SQL rather than Python."""
+    return g.db.execute(
+        _WEEK_TOTALS_SQL, (user_id, start.isoformat(), end.isoformat())
     ).fetchall()
-    return rows
 
 
-def owns_charge_code(user_id: int, charge_code_id: int) -> bool:
-    row = g.db.execute(
-        "SELECT 1 FROM charge_codes WHERE id = ? AND user_id = ?",
-        (charge_code_id, user_id),
-    ).fetchone()
-    return row is not None
+def list_charge_codes(user_id: int):
+    return g.db.execute(_LIST_CHARGE_CODES_SQL, (user_id,)).fetchall()
+
+
+def insert_time_entry(user_id: int, cleaned: Dict[str, object], now: str) -> Optional[int]:
+    """Insert an entry, enforcing charge-code ownership in the same statement.
+
+    Returns the new row id, or None when the charge code does not belong to
+    the user (the INSERT ... SELECT matches no row).
+    """
+    cur = g.db.execute(
+        _INSERT_ENTRY_SQL,
+        (
+            user_id,
+            cleaned["charge_code_id"],
+            cleaned["entry_date"].isoformat(),
+            cleaned["start_time"].strftime("%H:%M"),
+            cleaned["end_time"].strftime("%H:%M"),
+            cleaned["duration_minutes"],
+            cleaned["activity_text"],
+            now,
+            now,
+            cleaned["charge_code_id"],
+            user_id,
+        ),
+    )
+    g.db.commit()
+    return cur.lastrowid if cur.rowcount else None
+
+
+def update_time_entry_row(entry_id: int, user_id: int, cleaned: Dict[str, object], now: str) -> bool:
+    """Update an entry the user owns; False when the charge code is not theirs.
+
+    Callers have already confirmed the entry exists, so a zero rowcount means
+    the EXISTS guard on the charge code failed.
+    """
+    cur = g.db.execute(
+        _UPDATE_ENTRY_SQL,
+        (
+            cleaned["charge_code_id"],
+            cleaned["entry_date"].isoformat(),
+            cleaned["start_time"].strftime("%H:%M"),
+            cleaned["end_time"].strftime("%H:%M"),
+            cleaned["duration_minutes"],
+            cleaned["activity_text"],
+            now,
+            entry_id,
+            user_id,
+            cleaned["charge_code_id"],
+            user_id,
+        ),
+    )
+    g.db.commit()
+    return cur.rowcount > 0
 
 
 def charge_code_exists(user_id: int, project_number: str, task_number: str) -> bool:
@@ -633,7 +780,7 @@ def charge_code_exists(user_id: int, project_number: str, task_number: str) -> b
 
 
 def prepare_time_entry_payload(
-    user_id: int, payload: Mapping[str, object], existing: Optional[EntryDTO] = None
+    payload: Mapping[str, object], existing: Optional[EntryDTO] = None
 ) -> Tuple[Optional[str], Optional[Dict[str, object]]]:
     def _value(key: str, default: Optional[str] = None) -> Optional[str]:
         value = payload.get(key)
@@ -666,10 +813,10 @@ def prepare_time_entry_payload(
             return "Missing required fields.", None
 
         charge_code_id = int(str(charge_code_raw))
-        entry_date = datetime.strptime(entry_date_raw, "%Y-%m-%d").date()
+        entry_date = _parse_ymd(entry_date_raw)
         start_time = parse_time_str(start_time_raw)
         end_time = parse_time_str(end_time_raw)
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, AttributeError):
         return "Invalid payload.", None
 
     if start_time >= end_time:
@@ -679,8 +826,6 @@ def prepare_time_entry_payload(
     activity_text = activity_text.strip()
     if not activity_text:
         return "Activity text is required.", None
-    if not owns_charge_code(user_id, charge_code_id):
-        return "Invalid charge code.", None
 
     duration_minutes = difference_in_minutes(start_time, end_time)
     cleaned = {
@@ -694,28 +839,43 @@ def prepare_time_entry_payload(
     return None, cleaned
 
 
+def _request_json() -> Optional[Dict[str, object]]:
+    """Parse the request body with orjson in one shot, skipping Flask's caching.
+
+    Returns None for malformed or non-object JSON so callers can reject the
+    request outright; an empty payload must not be substituted, because on
+    updates every missing field defaults from the existing entry.
+    """
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def _dashboard_redirect_target(anchor_date: Optional[str]) -> str:
     if anchor_date:
         try:
-            datetime.strptime(anchor_date, "%Y-%m-%d")
+            _parse_ymd(anchor_date)
             return url_for("dashboard", date=anchor_date)
         except ValueError:
             pass
     return url_for("dashboard")
 
 
-def parse_time_str(value: str) -> time:
-    return datetime.strptime(value, "%H:%M").time()
+def _parse_ymd(value: str) -> date:
+    """Parse YYYY-MM-DD without the strptime format machinery."""
+    year, month, day = value.split("-")
+    return date(int(year), int(month), int(day))
 
 
-def difference_in_minutes(start: time, end: time) -> int:
-    delta = datetime.combine(date.today(), end) - datetime.combine(date.today(), start)
-    return int(delta.total_seconds() // 60)
+def parse_time_str(value: str) -> time:
+    hour, minute = value.split(":")
+    return time(int(hour), int(minute))
 
 
-def time_to_minutes(value: str) -> int:
-    parsed = parse_time_str(value)
-    return parsed.hour * 60 + parsed.minute
+def difference_in_minutes(start: time, end: time) -> int:
+    return (end.hour - start.hour) * 60 + (end.minute - start.minute)
 
 
 def calculate_week_bounds(anchor: date) -> Tuple[date, date]:
@@ -731,84 +891,107 @@ def group_entries_for_calendar(
     window_start: int = 0,
     window_end: int = 24 * 60,
 ) -> Dict[str, List[Dict[str, object]]]:
-    color_lookup = color_lookup or {}
+    get_color = (color_lookup or {}).get
+    px_per_minute = DEFAULT_CALENDAR_SLOT_HEIGHT / DEFAULT_CALENDAR_SLOT_MINUTES
     grouped: Dict[str, List[Dict[str, object]]] = {}
-    for entry in entries:
-        day_entries = grouped.setdefault(entry.entry_date, [])
-        start_minutes = time_to_minutes(entry.start_time)
-        entry_end = start_minutes + entry.duration_minutes
-        if entry_end <= window_start or start_minutes >= window_end:
-            continue
-        clamped_start = max(start_minutes, window_start)
-        clamped_end = min(entry_end, window_end)
-        relative_start = clamped_start - window_start
-        relative_duration = max(clamped_end - clamped_start, 1)
-        day_entries.append(
-            {
-                "id": entry.id,
-                "entry_date": entry.entry_date,
-                "charge_code_id": entry.charge_code_id,
-                "start_time": entry.start_time,
-                "end_time": entry.end_time,
-                "activity_text": entry.activity_text,
-                "charge_code_label": entry.charge_code_label,
-                "duration_minutes": entry.duration_minutes,
-                "start_minutes": start_minutes,
-                "end_minutes": entry_end,
-                "relative_start_minutes": relative_start,
-                "relative_duration_minutes": relative_duration,
-                "color_class": color_lookup.get(entry.charge_code_id, "charge-color-default"),
-            }
-        )
+    # Entries arrive sorted by (entry_date, start_time) from SQL, so groupby
+    # splits days without a hash lookup per entry.
+    for day, items in groupby(entries, key=attrgetter("entry_date")):
+        day_entries: List[Dict[str, object]] = []
+        for entry in items:
+            start_minutes = entry.start_minutes
+            entry_end = start_minutes + entry.duration_minutes
+            if entry_end <= window_start or start_minutes >= window_end:
+                continue
+            clamped_start = max(start_minutes, window_start)
+            clamped_end = min(entry_end, window_end)
+            relative_start = clamped_start - window_start
+            relative_duration = max(clamped_end - clamped_start, 1)
+            day_entries.append(
+                {
+                    "id": entry.id,
+                    "entry_date": entry.entry_date,
+                    "charge_code_id": entry.charge_code_id,
+                    "start_time": entry.start_time,
+                    "end_time": entry.end_time,
+                    "activity_text": entry.activity_text,
+                    "charge_code_label": entry.charge_code_label,
+                    "duration_minutes": entry.duration_minutes,
+                    "start_minutes": start_minutes,
+                    "end_minutes": entry_end,
+                    "top_px": round(relative_start * px_per_minute, 2),
+                    "height_px": round(relative_duration * px_per_minute, 2),
+                    "color_class": get_color(entry.charge_code_id, "charge-color-default"),
+                }
+            )
+        grouped[day] = day_entries
     return grouped
 
 
-def build_week_overview(entries: List[EntryDTO], week_start: date, week_end: date):
-    overview: Dict[str, Dict[str, Dict[str, object]]] = {}
+def build_week_overview(
+    entries: List[EntryDTO], totals: List[sqlite3.Row], week_start: date, week_end: date
+):
+    # Accumulate into flat parallel arrays indexed by label_idx * 7 + day_idx
+    # instead of a dict-of-dicts with a small dict per cell; the nested shape
+    # the template consumes is assembled once at the end.
     days = [(week_start + timedelta(days=i)).isoformat() for i in range(7)]
-    day_totals = {day: 0.0 for day in days}
-
+    day_index = {day: i for i, day in enumerate(days)}
+
+    labels: List[str] = []
+    label_index: Dict[str, int] = {}
+    hours_flat: List[float] = []
+    comments_flat: List[List[str]] = []
+    details_flat: List[List[Dict[str, str]]] = []
+    day_totals_flat = [0.0] * 7
+
+    def _label_idx(label: str) -> int:
+        idx = label_index.get(label)
+        if idx is None:
+            idx = label_index[label] = len(labels)
+            labels.append(label)
+            hours_flat.extend([0.0] * 7)
+            comments_flat.extend([] for _ in range(7))
+            details_flat.extend([] for _ in range(7))
+        return idx
+
+    for row in totals:
+        idx = _label_idx(row["label"])
+        day_idx = day_index[row["entry_date"]]
+        hours = row["minutes"] / 60
+        hours_flat[idx * 7 + day_idx] += hours
+        day_totals_flat[day_idx] += hours
+
+    # entries and totals come from two separate statements, so a write
+    # committed between them can surface a label here that has no totals
+    # row; register it rather than assuming the totals loop saw it.
     for entry in entries:
-        label = entry.charge_code_label
-        per_charge = overview.setdefault(
-            label,
-            {
-                day: {
-                    "hours": 0.0,
-                    "comments": [],
-                    "details": [],
-                }
-                for day in days
-            },
-        )
-        per_day = per_charge[entry.entry_date]
-        hours = entry.duration_minutes / 60
-        per_day["hours"] += hours
-        per_day["comments"].append(entry.activity_text)
-        per_day["details"].append(
+        offset = _label_idx(entry.charge_code_label) * 7 + day_index[entry.entry_date]
+        comments_flat[offset].append(entry.activity_text)
+        details_flat[offset].append(
             {
                 "start_time": entry.start_time,
                 "end_time": entry.end_time,
                 "activity_text": entry.activity_text,
             }
         )
-        day_totals[entry.entry_date] += hours
 
     rows = []
-    for label in sorted(overview.keys()):
-        per_charge = overview[label]
+    for label in sorted(labels):
+        base = label_index[label] * 7
         cells: Dict[str, Dict[str, object]] = {}
-        for day in days:
-            info = per_charge[day]
+        total_hours = 0.0
+        for day_idx, day in enumerate(days):
+            offset = base + day_idx
+            cell_hours = round(hours_flat[offset], 2)
             cells[day] = {
-                "hours": round(info["hours"], 2),
-                "comments": info["comments"],
-                "details": info["details"],
+                "hours": cell_hours,
+                "comments": comments_flat[offset],
+                "details": details_flat[offset],
             }
-        total_hours = round(sum(cell["hours"] for cell in cells.values()), 2)
-        rows.append({"label": label, "cells": cells, "total": total_hours})
+            total_hours += cell_hours
+        rows.append({"label": label, "cells": cells, "total": round(total_hours, 2)})
 
-    day_totals = {day: round(total, 2) for day, total in day_totals.items()}
+    day_totals = {day: round(day_totals_flat[i], 2) for i, day in enumerate(days)}
     week_total = round(sum(day_totals.values()), 2)
     return {"days": days, "rows": rows, "day_totals": day_totals, "week_total": week_total}
 